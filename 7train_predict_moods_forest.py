@@ -10,6 +10,7 @@ import random
 # Load the preprocessed dataset
 input_file = "ml_ready_chords.json"
 output_file = "ml_final_chords.json"
+forest_file = "mood_forest_arrays.npz"
 
 with open(input_file, "r") as f:
     chord_data = json.load(f)
@@ -33,6 +34,39 @@ def pad_or_truncate(progression, length=MAX_LENGTH):
         return progression + [0] * (length - len(progression))  # Pad with 0s
     return progression[:length]  # Truncate if too long
 
+def export_forest(forest, path):
+    """Flattens every tree of a fitted forest into shared NumPy node arrays.
+
+    Node indices are offset per tree so all trees live in one set of arrays;
+    `roots` holds the index of each tree's first node. Leaves keep sklearn's
+    markers (feature -2, children -1) and `value` keeps the per-leaf class
+    counts exactly as stored by sklearn.
+    """
+    features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+    offset = 0
+    for estimator in forest.estimators_:
+        tree = estimator.tree_
+        is_leaf = tree.children_left == -1
+        roots.append(offset)
+        features.append(tree.feature)
+        thresholds.append(tree.threshold)
+        lefts.append(np.where(is_leaf, -1, tree.children_left + offset))
+        rights.append(np.where(is_leaf, -1, tree.children_right + offset))
+        values.append(tree.value[:, 0, :])
+        offset += tree.node_count
+
+    np.savez(
+        path,
+        feature=np.concatenate(features).astype(np.int32),
+        threshold=np.concatenate(thresholds).astype(np.float64),
+        children_left=np.concatenate(lefts).astype(np.int32),
+        children_right=np.concatenate(rights).astype(np.int32),
+        value=np.concatenate(values).astype(np.float64),
+        roots=np.array(roots, dtype=np.int32),
+        max_depth=np.int32(max(e.tree_.max_depth for e in forest.estimators_)),
+        classes=np.asarray(forest.classes_, dtype=str),
+    )
+
 # Prepare training data
 X = [pad_or_truncate(entry["degrees"]) for entry in labeled_data]
 y = [entry["mood"] for entry in labeled_data]
@@ -44,6 +78,10 @@ X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_
 model = RandomForestClassifier(n_estimators=100, random_state=42)
 model.fit(X_train, y_train)
 
+# Export the trained forest as flat node arrays for the compiled evaluator
+export_forest(model, forest_file)
+print(f"Exported forest arrays to {forest_file}")
+
 # Evaluate model performance
 y_pred = model.predict(X_test)
 accuracy = accuracy_score(y_test, y_pred)
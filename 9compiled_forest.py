@@ -0,0 +1,123 @@
+import json
+import time
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.model_selection import train_test_split
+
+# Load the exported forest and the same dataset used for training
+forest_file = "mood_forest_arrays.npz"
+input_file = "ml_ready_chords.json"
+
+# Define a fixed progression length (must match 7train_predict_moods_forest.py)
+MAX_LENGTH = 8
+
+def pad_or_truncate(progression, length=MAX_LENGTH):
+    """Ensures all progressions have the same length."""
+    if len(progression) < length:
+        return progression + [0] * (length - len(progression))  # Pad with 0s
+    return progression[:length]  # Truncate if too long
+
+class CompiledForest:
+    """Pure-NumPy evaluator for a forest exported by `export_forest`.
+
+    All trees are walked together: each step advances every (tree, row)
+    pair one level down, so a prediction costs `max_depth` vectorized steps
+    regardless of the number of trees.
+    """
+
+    def __init__(self, path):
+        arrays = np.load(path)
+        self.classes = arrays["classes"]
+        self.roots = arrays["roots"].astype(np.intp)
+        self.max_depth = int(arrays["max_depth"])
+
+        feature = arrays["feature"].astype(np.intp)
+        left = arrays["children_left"].astype(np.intp)
+        right = arrays["children_right"].astype(np.intp)
+        is_leaf = left == -1
+        node_ids = np.arange(len(feature))
+
+        # Leaves point back at themselves so extra steps are harmless
+        self.feature = np.where(is_leaf, 0, feature)
+        self.threshold = arrays["threshold"]
+        # Children are interleaved so node i moves to children[2 * i + go_right]
+        self.children = np.column_stack(
+            [np.where(is_leaf, node_ids, left), np.where(is_leaf, node_ids, right)]
+        ).ravel()
+
+        # sklearn >= 1.4 stores leaf fractions and returns them as-is; older
+        # versions store class counts and normalize them in predict_proba
+        value = arrays["value"]
+        normalizer = value.sum(axis=1)
+        if (normalizer > 1.5).any():
+            normalizer[normalizer == 0.0] = 1.0
+            value = value / normalizer[:, np.newaxis]
+        self.leaf_proba = value
+
+    def apply(self, X):
+        """Returns the leaf index reached by every row in every tree, shape (n_trees, n_rows)."""
+        # sklearn compares float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        n_rows = X.shape[0]
+        # Feature-major layout turns each lookup into a single flat gather
+        X_flat = X.T.ravel()
+        rows = np.arange(n_rows)
+        nodes = np.repeat(self.roots[:, np.newaxis], n_rows, axis=1)
+        for _ in range(self.max_depth):
+            go_right = X_flat[self.feature[nodes] * n_rows + rows] > self.threshold[nodes]
+            nodes = self.children[2 * nodes + go_right]
+        return nodes
+
+    def predict_proba(self, X):
+        """Averages leaf probabilities over trees in the same order as sklearn."""
+        # Summing over the leading axis adds trees one after another, like
+        # RandomForestClassifier's accumulation, so results match bit-for-bit
+        proba = self.leaf_proba[self.apply(X)].sum(axis=0)
+        proba /= len(self.roots)
+        return proba
+
+    def predict(self, X):
+        """Returns the most likely mood for each row."""
+        return self.classes[np.argmax(self.predict_proba(X), axis=1)]
+
+def time_call(func, X, repeats):
+    """Returns the mean wall time of `func(X)` in microseconds."""
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func(X)
+    return (time.perf_counter() - start) / repeats * 1e6
+
+if __name__ == "__main__":
+    with open(input_file, "r") as f:
+        chord_data = json.load(f)
+
+    labeled_data = [entry for entry in chord_data if entry["mood"] != "Unknown"]
+
+    # Rebuild the reference model exactly as 7train_predict_moods_forest.py does
+    X = [pad_or_truncate(entry["degrees"]) for entry in labeled_data]
+    y = [entry["mood"] for entry in labeled_data]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    model = RandomForestClassifier(n_estimators=100, random_state=42)
+    model.fit(X_train, y_train)
+
+    compiled = CompiledForest(forest_file)
+
+    # Verify the compiled evaluator matches sklearn on every progression
+    X_all = np.array([pad_or_truncate(entry["degrees"]) for entry in chord_data], dtype=np.float64)
+    sklearn_proba = model.predict_proba(X_all)
+    compiled_proba = compiled.predict_proba(X_all)
+    proba_match = np.array_equal(sklearn_proba, compiled_proba)
+    label_match = np.array_equal(model.predict(X_all), compiled.predict(X_all))
+    print(f"Probabilities identical: {proba_match}")
+    print(f"Predictions identical: {label_match}")
+    if not (proba_match and label_match):
+        raise SystemExit("Compiled forest does not match sklearn predictions")
+
+    # Benchmark single-row and batch latency
+    single_row = X_all[:1]
+    print("\n Latency (mean per call):")
+    print(f"{'':<12}{'sklearn':>14}{'compiled':>14}{'speedup':>10}")
+    for name, batch, repeats in [("single row", single_row, 200), (f"batch {len(X_all)}", X_all, 10)]:
+        sklearn_us = time_call(model.predict, batch, repeats)
+        compiled_us = time_call(compiled.predict, batch, repeats)
+        print(f"{name:<12}{sklearn_us:>12.1f}us{compiled_us:>12.1f}us{sklearn_us / compiled_us:>9.1f}x")